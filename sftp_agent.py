@@ -0,0 +1,137 @@
+# pip install paramiko
+# Long-lived SFTP agent: keeps one SSH transport to the logging host open
+# and serves analyze_temps.py over a Unix domain socket, so repeated runs
+# skip the SSH handshake (key exchange + auth) entirely. Start it once
+# alongside the analysis script:
+#
+#   python sftp_agent.py
+#
+import json
+import logging
+import os
+import socket
+from datetime import datetime
+
+import paramiko
+from config import SSH_HOST, SSH_USER, SSH_KEY_PATH, REMOTE_FILE_PATH
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+AGENT_SOCKET = './cache/sftp_agent.sock'
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def connect():
+    logger.info("Connecting to %s", SSH_HOST)
+    # Same socket tuning as analyze_temps.py: wide buffers and NODELAY so
+    # SFTP reads pipeline instead of stalling per request
+    sock = socket.create_connection((SSH_HOST, 22))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 * 1024 * 1024)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024 * 1024)
+
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    ssh.connect(SSH_HOST, username=SSH_USER, key_filename=SSH_KEY_PATH,
+                sock=sock)
+    return ssh
+
+
+def find_start(sftp, start_time):
+    # Same byte-offset bisect as analyze_temps.find_start_offset, run on
+    # the agent's side of the socket so it reuses the open transport
+    start = datetime.strptime(start_time, TIME_FORMAT)
+    try:
+        file_size = sftp.stat(REMOTE_FILE_PATH).st_size
+        with sftp.open(REMOTE_FILE_PATH, 'rb') as remote_file:
+            lo, hi = 0, file_size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                remote_file.seek(mid)
+                remote_file.readline()  # skip partial row (or the header)
+                line = remote_file.readline()
+                if line and datetime.strptime(
+                        line.decode().split(',')[0], TIME_FORMAT) < start:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            remote_file.seek(lo)
+            remote_file.readline()
+            return remote_file.tell()
+    except (ValueError, OSError) as e:
+        logger.warning("Start-time bisect failed: %s", str(e))
+        return 0
+
+
+def handle(sftp, command):
+    cmd = command.get("cmd")
+
+    if cmd == "stat":
+        stat = sftp.stat(REMOTE_FILE_PATH)
+        return {"ok": True, "size": stat.st_size,
+                "mtime": stat.st_mtime}, b''
+
+    if cmd == "find_start":
+        offset = find_start(sftp, command["start_time"])
+        return {"ok": True, "offset": offset}, b''
+
+    if cmd == "read":
+        offset = command.get("offset", 0)
+        # Read exactly the requested range, not to EOF: rows appended
+        # during the transfer must not leak past the client's stat'ed size
+        length = command.get("length")
+        if length is None:
+            length = sftp.stat(REMOTE_FILE_PATH).st_size - offset
+        with sftp.open(REMOTE_FILE_PATH, 'rb') as remote_file:
+            remote_file.MAX_REQUEST_SIZE = 1024 * 1024
+            remote_file.set_pipelined(True)
+            remote_file.seek(offset)
+            remote_file.prefetch(offset + length)
+            payload = remote_file.read(length)
+        return {"ok": True, "length": len(payload)}, payload
+
+    return {"ok": False, "error": f"unknown command: {cmd}"}, b''
+
+
+def serve():
+    os.makedirs(os.path.dirname(AGENT_SOCKET), exist_ok=True)
+    if os.path.exists(AGENT_SOCKET):
+        os.remove(AGENT_SOCKET)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(AGENT_SOCKET)
+    server.listen(1)
+
+    ssh = connect()
+    sftp = ssh.open_sftp()
+    logger.info("Serving on %s", AGENT_SOCKET)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                line = conn.makefile('rb').readline()
+                if not line:
+                    continue
+                try:
+                    header, payload = handle(sftp, json.loads(line))
+                except Exception as e:  # keep serving after a bad request
+                    logger.error("Request failed: %s", str(e))
+                    header, payload = {"ok": False, "error": str(e)}, b''
+                conn.sendall((json.dumps(header) + '\n').encode())
+                if payload:
+                    conn.sendall(payload)
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        sftp.close()
+        ssh.close()
+        server.close()
+        os.remove(AGENT_SOCKET)
+
+
+if __name__ == "__main__":
+    serve()